@@ -0,0 +1,5 @@
+"""Allow `python -m las_dice` to invoke the CLI."""
+
+from .cli import main
+
+main()
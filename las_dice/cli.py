@@ -2,22 +2,37 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import click
 
-from .core import clipper, paths, tindex
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+    from .core import paths
+
+# Heavy geospatial modules (clipper, crs, paths, polygons) pull in
+# geopandas/shapely/fiona and are imported inside the functions that need
+# them, keeping --help and simple commands fast.
+from .core import tindex
 from .core.utils import (
+    OUTPUT_EXTENSION,
     NamingOptions,
     build_name_getter,
-    build_output_path,
+    jsonl_log_stream,
     log_info,
     progress_tracker,
+    sanitize,
+    sanitize_series,
     status,
 )
 from .io import config as config_io
-from .io import polygons
 
 
 def _clean_path(value: str) -> Path:
@@ -34,6 +49,8 @@ def cli() -> None:
 @click.option("--layer", help="Layer name for GeoPackage sources.")
 def list_fields(source: Path, layer: str | None) -> None:
     """List attribute fields available in a polygon dataset."""
+    from .io import polygons
+
     try:
         for line in polygons.describe_fields(source, layer):
             click.echo(line)
@@ -49,7 +66,11 @@ def _prompt_las_root() -> Path:
     return path
 
 
-def _run_wizard(config_path: Path) -> config_io.RunConfig:
+def _run_wizard(
+    config_path: Path,
+) -> Tuple[config_io.RunConfig, "gpd.GeoDataFrame", List[str]]:
+    from .io import polygons
+
     click.echo("LAS Dice setup wizard")
     click.echo("---------------------")
     polygons_input = click.prompt("Polygon dataset path")
@@ -151,113 +172,331 @@ def _run_wizard(config_path: Path) -> config_io.RunConfig:
         target_srs=polygon_crs,
     )
     config_io.save_config(config, config_path)
-    return config
+    return config, preview_gdf, fields
+
+
+class ClipResult(NamedTuple):
+    """Lightweight per-polygon outcome record; tuples beat dicts on memory."""
 
+    polygon_id: int
+    output: str
+    sources: int
+    status: str
+    error: str = ""
 
-def _summarise_results(results: List[dict]) -> None:
-    written = len([row for row in results if row["status"] == "written"])
-    skipped = len([row for row in results if row["status"] == "exists"])
-    errors = [row for row in results if row["status"] == "error"]
+
+def _summarise_results(counts: Counter, errors: List[ClipResult]) -> None:
     log_info(
-        f"Run summary: {written} written, {skipped} skipped (already existed), {len(errors)} errors"
+        f"Run summary: {counts['written']} written, {counts['exists']} skipped (already existed), {len(errors)} errors"
     )
     if errors:
         log_info("Errored polygons:")
         for row in errors:
-            log_info(f"  Polygon {row['polygon_id']} -> {row['output']}: {row['error']}")
+            log_info(f"  Polygon {row.polygon_id} -> {row.output}: {row.error}")
 
 
 def _build_name_wrapper(poly_gdf, name_field: Optional[str], suffix: Optional[str]):
+    if name_field and name_field in poly_gdf.columns:
+        names = sanitize_series(poly_gdf[name_field])
+        if suffix:
+            names = names + f"_{sanitize(suffix)}"
+        names_list = names.tolist()
+        return lambda polygon_id: names_list[polygon_id]
+
     options = NamingOptions(field=name_field, suffix=suffix)
     getter = build_name_getter(options)
-
-    def wrapper(polygon_id: int) -> str:
-        attrs = poly_gdf.iloc[polygon_id].to_dict()
+    records = poly_gdf.drop(columns=poly_gdf.geometry.name).to_dict(orient="records")
+    names_list = []
+    for polygon_id, attrs in enumerate(records):
         attrs.setdefault("polygon_id", polygon_id)
-        return getter(attrs)
-
-    return wrapper
+        names_list.append(getter(attrs))
+    return lambda polygon_id: names_list[polygon_id]
 
 
 def _plan_outputs(
-    poly_gdf, matches: Sequence[paths.PolygonSources], outdir: Path, name_builder
-) -> Tuple[List[Tuple[paths.PolygonSources, Path]], List[int]]:
-    planned: List[Tuple[paths.PolygonSources, Path]] = []
-    empties: List[int] = []
-    for record in matches:
-        if not record.source_paths:
-            empties.append(record.polygon_id)
-            continue
-        name = name_builder(record.polygon_id)
-        output_path = build_output_path(name, outdir)
-        planned.append((record, output_path))
+    poly_gdf,
+    matches: Sequence[paths.PolygonSources],
+    outdir: Path,
+    name_builder,
+    extension: str = OUTPUT_EXTENSION,
+) -> Tuple[List[Tuple[paths.PolygonSources, str]], List[int]]:
+    """Plan (record, output file name) pairs; names stay strings until the PDAL boundary."""
+    empties = [record.polygon_id for record in matches if not record.source_paths]
+    planned = [
+        (record, name_builder(record.polygon_id) + extension)
+        for record in matches
+        if record.source_paths
+    ]
     return planned, empties
 
 
+CROP_LAYER = "crop_polygons"
+
+
+def _write_crop_source(poly_gdf, polygon_ids: List[int]) -> Optional[Tuple[Path, Path]]:
+    """Write pending polygons to a temp GeoPackage for by-id OGR crop references.
+
+    Returns (tempdir, datasource) on success, or None to signal the inline-WKT
+    fallback.
+    """
+    import geopandas as gpd
+
+    tmpdir = Path(tempfile.mkdtemp(prefix="las_dice_crops_"))
+    datasource = tmpdir / "crop_polygons.gpkg"
+    try:
+        subset = gpd.GeoDataFrame(
+            {"polygon_id": polygon_ids},
+            geometry=poly_gdf.geometry.values[polygon_ids],
+            crs=poly_gdf.crs,
+        )
+        subset.to_file(datasource, layer=CROP_LAYER, driver="GPKG")
+    except Exception as exc:  # pragma: no cover
+        log_info(f"Crop datasource write failed ({exc}); using inline WKT")
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        return None
+    return tmpdir, datasource
+
+
+def _clip_one(
+    record: paths.PolygonSources,
+    output_path: Path,
+    crop: dict,
+    output_srs: Optional[str],
+) -> ClipResult:
+    """Clip one polygon in a worker process; the crop spec is built by the parent."""
+    from .core import clipper
+
+    try:
+        clipper.clip_single_crop(
+            crop,
+            record.source_paths,
+            output_path,
+            output_srs=output_srs,
+            ensure_dir=False,
+        )
+    except Exception as exc:  # pragma: no cover
+        return ClipResult(
+            polygon_id=record.polygon_id,
+            output=str(output_path),
+            sources=len(record.source_paths),
+            status="error",
+            error=str(exc),
+        )
+    return ClipResult(
+        polygon_id=record.polygon_id,
+        output=str(output_path),
+        sources=len(record.source_paths),
+        status="written",
+    )
+
+
+def _clip_group(
+    entries: Sequence[Tuple[paths.PolygonSources, Path, dict]],
+    output_srs: Optional[str],
+) -> List[ClipResult]:
+    """Clip a group of polygons that share the same source tiles in one worker.
+
+    The whole group runs as one PDAL pipeline so each source is read once;
+    if that pipeline fails, fall back to per-polygon clips to isolate the
+    offending polygon instead of failing the group wholesale.
+    """
+    from .core import clipper
+
+    source_paths = entries[0][0].source_paths
+    if len(entries) > 1:
+        clips = [(crop, output_path) for _, output_path, crop in entries]
+        try:
+            clipper.clip_group_crop(
+                clips, source_paths, output_srs=output_srs, ensure_dirs=False
+            )
+        except Exception:  # pragma: no cover
+            pass
+        else:
+            return [
+                ClipResult(
+                    polygon_id=record.polygon_id,
+                    output=str(output_path),
+                    sources=len(record.source_paths),
+                    status="written",
+                )
+                for record, output_path, _ in entries
+            ]
+    return [
+        _clip_one(record, output_path, crop, output_srs)
+        for record, output_path, crop in entries
+    ]
+
+
+RESULTS_LOG_NAME = "clip_results.jsonl"
+
+
 def _execute_clips(
-    planned: Sequence[Tuple[paths.PolygonSources, Path]],
+    planned: Sequence[Tuple[paths.PolygonSources, str]],
     poly_gdf,
     outdir: Path,
     output_srs: Optional[str],
-) -> List[dict]:
-    results: List[dict] = []
+    jobs: Optional[int] = None,
+) -> Tuple[Counter, List[ClipResult]]:
+    """Run planned clips, streaming each outcome to a JSONL log as it lands.
+
+    Only status counters and the (usually tiny) error rows stay in memory;
+    the full per-polygon record goes straight to disk.
+    """
+    counts: Counter = Counter()
+    errors: List[ClipResult] = []
     if not planned:
-        return results
+        return counts, errors
 
-    with progress_tracker("Clipping LAS", total=len(planned)) as advance:
-        for record, output_path in planned:
-            if output_path.exists():
+    outdir_prefix = os.fspath(outdir) + os.sep
+    existing = (
+        {entry.name for entry in os.scandir(outdir)} if outdir.is_dir() else set()
+    )
+    # One upfront mkdir; workers are told to skip their per-output checks.
+    outdir.mkdir(parents=True, exist_ok=True)
+    with jsonl_log_stream(outdir / RESULTS_LOG_NAME) as append_row, progress_tracker(
+        "Clipping LAS", total=len(planned)
+    ) as advance:
+
+        def record_result(row: ClipResult) -> None:
+            counts[row.status] += 1
+            if row.status == "error":
+                errors.append(row)
+            append_row(row._asdict())
+            advance()
+
+        pending: List[Tuple[paths.PolygonSources, str]] = []
+        for record, output_name in planned:
+            if output_name in existing:
                 log_info(
-                    f"Polygon {record.polygon_id}: output exists ({output_path}); skipping"
-                )
-                results.append(
-                    {
-                        "polygon_id": record.polygon_id,
-                        "output": str(output_path),
-                        "sources": len(record.source_paths),
-                        "status": "exists",
-                    }
-                )
-                advance()
-                continue
-            try:
-                clipper.clip_polygons(
-                    polygons=poly_gdf.geometry,
-                    polygon_records=[record],
-                    output_dir=outdir,
-                    name_builder=lambda _: output_path.name,
-                    output_srs=output_srs,
+                    f"Polygon {record.polygon_id}: output exists ({outdir_prefix}{output_name}); skipping"
                 )
-            except Exception as exc:  # pragma: no cover
-                log_info(f"Polygon {record.polygon_id}: ERROR {exc}")
-                results.append(
-                    {
-                        "polygon_id": record.polygon_id,
-                        "output": str(output_path),
-                        "sources": len(record.source_paths),
-                        "status": "error",
-                        "error": str(exc),
-                    }
+                record_result(
+                    ClipResult(
+                        polygon_id=record.polygon_id,
+                        output=outdir_prefix + output_name,
+                        sources=len(record.source_paths),
+                        status="exists",
+                    )
                 )
-                advance()
                 continue
-            log_info(
-                f"Polygon {record.polygon_id}: wrote {output_path} from {len(record.source_paths)} sources"
-            )
-            results.append(
-                {
-                    "polygon_id": record.polygon_id,
-                    "output": str(output_path),
-                    "sources": len(record.source_paths),
-                    "status": "written",
-                }
+            pending.append((record, output_name))
+
+        if not pending:
+            return counts, errors
+
+        from .core import clipper
+
+        # Crops reference a temp GeoPackage by polygon_id where possible, so
+        # detailed geometries never travel through pipeline JSON; when that
+        # write fails, WKT for all pending polygons is serialized in one
+        # vectorized GEOS pass. Workers never touch GEOS either way.
+        geometries = poly_gdf.geometry.values
+        pending_ids = [record.polygon_id for record, _ in pending]
+        crop_dir: Optional[Path] = None
+        crop_source = _write_crop_source(poly_gdf, pending_ids)
+        if crop_source is not None:
+            crop_dir, datasource = crop_source
+            crops = [
+                clipper.crop_from_ogr(datasource, CROP_LAYER, polygon_id)
+                for polygon_id in pending_ids
+            ]
+        else:
+            crops = [
+                clipper.crop_from_wkt(polygon_wkt)
+                for polygon_wkt in clipper.geometries_to_wkt(geometries[pending_ids])
+            ]
+        groups: Dict[frozenset, List[Tuple[paths.PolygonSources, Path, dict]]] = (
+            defaultdict(list)
+        )
+        for (record, output_name), crop in zip(pending, crops):
+            groups[frozenset(record.source_paths)].append(
+                (record, Path(outdir_prefix + output_name), crop)
             )
-            advance()
-    return results
 
-def run_workflow(config_path: Path) -> None:
+        # Submit groups in leading-tile order rather than polygon-id order:
+        # neighbouring groups overlap in source tiles, so consecutive
+        # pipelines tend to find their LAZ sources warm in the page cache.
+        ordered_groups = sorted(
+            groups.values(), key=lambda entries: min(entries[0][0].source_paths)
+        )
+        max_workers = min(jobs or os.cpu_count() or 1, len(ordered_groups))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(_clip_group, entries, output_srs)
+                    for entries in ordered_groups
+                ]
+                for future in as_completed(futures):
+                    for row in future.result():
+                        if row.status == "error":
+                            log_info(f"Polygon {row.polygon_id}: ERROR {row.error}")
+                        else:
+                            log_info(
+                                f"Polygon {row.polygon_id}: wrote {row.output} from {row.sources} sources"
+                            )
+                        record_result(row)
+        finally:
+            if crop_dir is not None:
+                shutil.rmtree(crop_dir, ignore_errors=True)
+    return counts, errors
+
+def _tindex_query_bbox(
+    tindex_path: Path, layer: str, poly_gdf
+) -> Optional[Tuple[float, float, float, float]]:
+    """Polygon bounds for bbox pushdown when the tindex shares the polygon CRS.
+
+    Uses a metadata-only probe to compare CRS; returns None (read everything)
+    whenever the relationship cannot be established without decoding features.
+    """
+    if poly_gdf.crs is None:
+        return None
+    try:
+        import pyogrio
+
+        info = pyogrio.read_info(os.fspath(tindex_path), layer=layer)
+    except Exception:
+        return None
+    from .core import crs
+
+    tindex_crs = info.get("crs")
+    if tindex_crs and crs.crs_equal(tindex_crs, poly_gdf.crs):
+        return tuple(poly_gdf.total_bounds)
+    return None
+
+
+def _vacuum_tindex(tindex_path: Path) -> None:
+    if tindex_path.suffix.lower() != ".gpkg":
+        return
+    try:
+        size_before, size_after = tindex.vacuum_gpkg(tindex_path)
+    except Exception as exc:  # pragma: no cover
+        log_info(f"Vacuum skipped for {tindex_path}: {exc}")
+        return
+    log_info(f"Vacuumed {tindex_path}: {size_before} -> {size_after} bytes")
+
+
+def _write_lax_sidecars(roots: Sequence[Path]) -> None:
+    try:
+        with status("Writing .lax spatial indices..."):
+            indexed = tindex.ensure_lax_sidecars(roots)
+    except tindex.TindexError as exc:
+        log_info(str(exc))
+        return
+    if indexed:
+        log_info(f"Wrote .lax sidecars for {len(indexed)} files")
+
+
+def run_workflow(
+    config_path: Path,
+    jobs: Optional[int] = None,
+    write_lax: bool = True,
+    vacuum: bool = True,
+    output_format: str = "laz",
+) -> None:
     """Run the full LAS Dice workflow after collecting configuration interactively."""
-    config = _run_wizard(config_path)
+    from .core import crs, paths
+
+    config, poly_gdf, _ = _run_wizard(config_path)
 
     log_info("Starting LAS Dice workflow")
     try:
@@ -274,24 +513,47 @@ def run_workflow(config_path: Path) -> None:
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
 
+    if vacuum:
+        _vacuum_tindex(config.tindex_path)
+    if write_lax:
+        _write_lax_sidecars(config.las_roots)
+
     for line in tindex.describe_tindex(config.tindex_path, config.tindex_layer):
         log_info(line)
 
+    if (
+        config.target_srs
+        and poly_gdf.crs is not None
+        and poly_gdf.crs.to_string() != config.target_srs
+    ):
+        poly_gdf = poly_gdf.to_crs(config.target_srs)
+
     try:
-        poly_gdf, _, _, fields = polygons.read_polygons(config.polygons, config.polygons_layer)
-        tindex_gdf = tindex.read_tindex(config.tindex_path, config.tindex_layer)
+        bbox = _tindex_query_bbox(config.tindex_path, config.tindex_layer, poly_gdf)
+        tindex_gdf = tindex.read_tindex(
+            config.tindex_path, config.tindex_layer, bbox=bbox
+        )
         matches = paths.match_polygons_with_empty_reports(poly_gdf, tindex_gdf)
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
 
     name_wrapper = _build_name_wrapper(poly_gdf, config.name_field, config.suffix)
-    planned, empties = _plan_outputs(poly_gdf, matches, config.output_dir, name_wrapper)
+    planned, empties = _plan_outputs(
+        poly_gdf, matches, config.output_dir, name_wrapper, extension=f".{output_format}"
+    )
 
     for pid in empties:
         log_info(f"Polygon {pid}: no intersecting LAS files")
 
-    results = _execute_clips(planned, poly_gdf, config.output_dir, output_srs=config.target_srs)
-    _summarise_results(results)
+    output_srs = config.target_srs
+    if output_srs and crs.crs_equal(tindex_gdf.crs, output_srs):
+        # Forwarded VLRs already carry this CRS; skip the writer's SRS override.
+        output_srs = None
+
+    counts, errors = _execute_clips(
+        planned, poly_gdf, config.output_dir, output_srs=output_srs, jobs=jobs
+    )
+    _summarise_results(counts, errors)
     config_io.save_config(config, config_path)
     log_info("Workflow completed")
 
@@ -316,6 +578,25 @@ def init_cmd(config_path: Path) -> None:
 @click.option("--driver", default=tindex.TINDEX_DRIVER, show_default=True)
 @click.option("--overwrite", is_flag=True, help="Allow overwriting an existing tindex file.")
 @click.option("--fast-boundary", is_flag=True, help="Use PDAL fast boundary (bbox) instead of convex hull.")
+@click.option(
+    "--tindex-format",
+    type=click.Choice(["gpkg", "parquet"]),
+    default="gpkg",
+    show_default=True,
+    help="Tindex storage format; parquet reloads much faster for read-heavy runs.",
+)
+@click.option(
+    "--write-lax/--no-write-lax",
+    default=True,
+    show_default=True,
+    help="Write .lax spatial-index sidecars for source files (requires lasindex).",
+)
+@click.option(
+    "--vacuum/--no-vacuum",
+    default=True,
+    show_default=True,
+    help="VACUUM/ANALYZE GeoPackage tindex after build.",
+)
 def build_tindex_cmd(
     roots: Tuple[Path, ...],
     output: Path,
@@ -323,10 +604,18 @@ def build_tindex_cmd(
     driver: str,
     overwrite: bool,
     fast_boundary: bool,
+    tindex_format: str,
+    write_lax: bool,
+    vacuum: bool,
 ) -> None:
     """Build a PDAL tile index from LAS/LAZ roots."""
     if not roots:
         raise click.UsageError("Provide at least one root directory")
+    if (tindex_format == "parquet") != (output.suffix.lower() == ".parquet"):
+        raise click.UsageError(
+            "Output suffix and --tindex-format disagree; "
+            "use a .parquet output with --tindex-format parquet"
+        )
     if output.exists() and not overwrite:
         raise click.ClickException(
             "Tindex destination already exists. Use --overwrite or choose a new file."
@@ -336,10 +625,20 @@ def build_tindex_cmd(
     try:
         with status("Building tile index..."):
             result = tindex.build_tindex(
-                roots, output, layer, driver, overwrite=overwrite, fast_boundary=fast_boundary
+                roots,
+                output,
+                layer,
+                driver,
+                overwrite=overwrite,
+                fast_boundary=fast_boundary,
+                tindex_format=tindex_format,
             )
     except Exception as exc:  # pragma: no cover
         raise click.ClickException(str(exc)) from exc
+    if vacuum:
+        _vacuum_tindex(result)
+    if write_lax:
+        _write_lax_sidecars(list(roots))
     click.echo(f"Tile index written to {result}")
 
 
@@ -363,6 +662,15 @@ def validate_tindex_cmd(tindex_path: Path, layer: str) -> None:
 @click.option("--tindex-layer", default=tindex.TINDEX_LAYER, show_default=True)
 @click.option("--outdir", required=True, type=click.Path(file_okay=False, path_type=Path))
 @click.option("--suffix", help="Optional suffix for output names.")
+@click.option("--jobs", type=int, help="Maximum parallel clip workers (default: CPU count).")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["las", "laz"]),
+    default="laz",
+    show_default=True,
+    help="Output format for clipped files.",
+)
 def clip_cmd(
     polygons_path: Path,
     layer: Optional[str],
@@ -371,22 +679,33 @@ def clip_cmd(
     tindex_layer: str,
     outdir: Path,
     suffix: Optional[str],
+    jobs: Optional[int],
+    output_format: str,
 ) -> None:
+    from .core import crs, paths
+    from .io import polygons
+
     try:
-        poly_gdf, _, _, _ = polygons.read_polygons(polygons_path, layer)
-        tindex_gdf = tindex.read_tindex(tindex_path, tindex_layer)
+        poly_gdf, poly_crs, _, _ = polygons.read_polygons(polygons_path, layer)
+        bbox = _tindex_query_bbox(tindex_path, tindex_layer, poly_gdf)
+        tindex_gdf = tindex.read_tindex(tindex_path, tindex_layer, bbox=bbox)
         matches = paths.match_polygons_with_empty_reports(poly_gdf, tindex_gdf)
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
 
     name_wrapper = _build_name_wrapper(poly_gdf, name_field, suffix)
-    planned, empties = _plan_outputs(poly_gdf, matches, outdir, name_wrapper)
+    planned, empties = _plan_outputs(
+        poly_gdf, matches, outdir, name_wrapper, extension=f".{output_format}"
+    )
 
     for pid in empties:
         log_info(f"Polygon {pid}: no intersecting LAS files")
 
-    results = _execute_clips(planned, poly_gdf, outdir, output_srs=poly_crs)
-    _summarise_results(results)
+    output_srs = None if crs.crs_equal(tindex_gdf.crs, poly_crs) else poly_crs
+    counts, errors = _execute_clips(
+        planned, poly_gdf, outdir, output_srs=output_srs, jobs=jobs
+    )
+    _summarise_results(counts, errors)
 
 
 @cli.command(name="run")
@@ -397,9 +716,42 @@ def clip_cmd(
     default=config_io.DEFAULT_CONFIG_NAME,
     help="Configuration file to save.",
 )
-def run_cmd(config_path: Path) -> None:
+@click.option("--jobs", type=int, help="Maximum parallel clip workers (default: CPU count).")
+@click.option(
+    "--write-lax/--no-write-lax",
+    default=True,
+    show_default=True,
+    help="Write .lax spatial-index sidecars for source files (requires lasindex).",
+)
+@click.option(
+    "--vacuum/--no-vacuum",
+    default=True,
+    show_default=True,
+    help="VACUUM/ANALYZE GeoPackage tindex after build.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["las", "laz"]),
+    default="laz",
+    show_default=True,
+    help="Output format for clipped files.",
+)
+def run_cmd(
+    config_path: Path,
+    jobs: Optional[int],
+    write_lax: bool,
+    vacuum: bool,
+    output_format: str,
+) -> None:
     """Execute full workflow using a fresh configuration."""
-    run_workflow(config_path)
+    run_workflow(
+        config_path,
+        jobs=jobs,
+        write_lax=write_lax,
+        vacuum=vacuum,
+        output_format=output_format,
+    )
 
 
 def main() -> None:
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from geopandas import GeoSeries
 from shapely import to_wkt as shapely_to_wkt
@@ -13,6 +14,11 @@ from shapely import to_wkt as shapely_to_wkt
 from .paths import PolygonSources
 from .utils import log_info
 
+try:  # orjson serializes pipeline dicts several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class ClippingError(RuntimeError):
     """Raised when PDAL clipping fails."""
@@ -22,21 +28,63 @@ def _ensure_output_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _geometry_to_wkt(geometry) -> str:
+def _ensure_output_dirs(paths: Iterable[Path]) -> None:
+    """Create the distinct parent directories once instead of per output."""
+    for parent in {path.parent for path in paths}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+
+def geometry_to_wkt(geometry) -> str:
+    """Serialize a polygon geometry to the WKT form PDAL's crop filter expects."""
     try:
         return shapely_to_wkt(geometry, rounding_precision=8)
     except Exception as exc:  # pragma: no cover
         raise ClippingError("Failed to serialize polygon geometry to WKT") from exc
 
 
-def _build_pipeline(
-    input_files: List[Path],
-    polygon_wkt: str,
-    output_path: Path,
-    forward_vlrs: bool = True,
-    output_srs: Optional[str] = None,
+def geometries_to_wkt(geometries) -> List[str]:
+    """Vectorized geometry_to_wkt: one GEOS WKT-writer pass over the array."""
+    try:
+        return list(shapely_to_wkt(geometries, rounding_precision=8))
+    except Exception as exc:  # pragma: no cover
+        raise ClippingError("Failed to serialize polygon geometries to WKT") from exc
+
+
+def crop_from_wkt(polygon_wkt: str) -> dict:
+    """Crop-filter options for an inline WKT polygon."""
+    return {"polygon": polygon_wkt}
+
+
+def crop_from_ogr(
+    datasource: Path | str,
+    layer: str,
+    polygon_id: int,
+    id_field: str = "polygon_id",
 ) -> dict:
-    readers = [
+    """Crop-filter options referencing one polygon in an OGR datasource.
+
+    Keeps the pipeline JSON tiny for detailed polygons: PDAL pulls the
+    geometry straight from the datasource instead of parsing embedded WKT.
+    """
+    return {
+        "ogr": {
+            "datasource": str(datasource),
+            "sql": f'SELECT geom FROM "{layer}" WHERE {id_field} = {int(polygon_id)}',
+        }
+    }
+
+
+def _crop_stage(crop: dict, tag: Optional[str] = None, inputs: Optional[List[str]] = None) -> dict:
+    stage = {"type": "filters.crop", **crop}
+    if tag:
+        stage["tag"] = tag
+    if inputs:
+        stage["inputs"] = inputs
+    return stage
+
+
+def _reader_stages(input_files: List[Path]) -> List[dict]:
+    return [
         {
             "type": "readers.las",
             "filename": str(path),
@@ -44,12 +92,11 @@ def _build_pipeline(
         }
         for path in input_files
     ]
-    filters = [
-        {
-            "type": "filters.crop",
-            "polygon": polygon_wkt,
-        }
-    ]
+
+
+def _writer_stage(
+    output_path: Path, forward_vlrs: bool, output_srs: Optional[str]
+) -> dict:
     writer = {
         "type": "writers.las",
         "filename": str(output_path),
@@ -58,16 +105,80 @@ def _build_pipeline(
         "scale_y": 0.01,
         "scale_z": 0.01,
     }
+    if output_path.suffix.lower() == ".laz":
+        writer["compression"] = "true"
     if output_srs:
         writer["a_srs"] = output_srs
-    return {"pipeline": readers + filters + [writer]}
+    return writer
+
+
+def _build_pipeline(
+    input_files: List[Path],
+    crop: dict,
+    output_path: Path,
+    forward_vlrs: bool = True,
+    output_srs: Optional[str] = None,
+) -> dict:
+    writer = _writer_stage(output_path, forward_vlrs, output_srs)
+    return {"pipeline": _reader_stages(input_files) + [_crop_stage(crop), writer]}
+
+
+def _build_group_pipeline(
+    input_files: List[Path],
+    clips: Sequence[Tuple[dict, Path]],
+    forward_vlrs: bool = True,
+    output_srs: Optional[str] = None,
+) -> dict:
+    """One pipeline reading shared sources once, fanning out per polygon.
+
+    Stage tags turn the pipeline into a DAG: every crop pulls from the tagged
+    readers and feeds its own writer, so each source is decompressed once for
+    the whole group.
+    """
+    readers = _reader_stages(input_files)
+    for index, reader in enumerate(readers):
+        reader["tag"] = f"src_{index}"
+    source_tags = [reader["tag"] for reader in readers]
+    stages: List[dict] = list(readers)
+    for index, (crop, output_path) in enumerate(clips):
+        stages.append(_crop_stage(crop, tag=f"crop_{index}", inputs=source_tags))
+        writer = _writer_stage(output_path, forward_vlrs, output_srs)
+        writer["tag"] = f"out_{index}"
+        writer["inputs"] = [f"crop_{index}"]
+        stages.append(writer)
+    return {"pipeline": stages}
+
+
+@lru_cache(maxsize=1)
+def _pdal_module():
+    """The pdal Python bindings, or None when only the CLI is available."""
+    try:
+        import pdal
+    except ImportError:
+        return None
+    return pdal
+
+
+def _serialize_pipeline(pipeline: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(pipeline)
+    return json.dumps(pipeline).encode("utf-8")
 
 
 def _run_pipeline(pipeline: dict) -> None:
-    pipeline_json = json.dumps(pipeline)
+    pipeline_bytes = _serialize_pipeline(pipeline)
+    pdal = _pdal_module()
+    if pdal is not None:
+        # In-process execution skips fork/exec and GDAL/PROJ re-initialization
+        # on every clip.
+        try:
+            pdal.Pipeline(pipeline_bytes.decode("utf-8")).execute()
+        except Exception as exc:
+            raise ClippingError(str(exc)) from exc
+        return
     process = subprocess.run(
         ["pdal", "pipeline", "--stdin"],
-        input=pipeline_json.encode("utf-8"),
+        input=pipeline_bytes,
         check=False,
         capture_output=True,
     )
@@ -75,6 +186,100 @@ def _run_pipeline(pipeline: dict) -> None:
         raise ClippingError(process.stderr.decode("utf-8"))
 
 
+def clip_single_crop(
+    crop: dict,
+    source_paths: List[Path],
+    output_path: Path,
+    forward_vlrs: bool = True,
+    output_srs: Optional[str] = None,
+    ensure_dir: bool = True,
+) -> Path:
+    """Clip the given LAS/LAZ sources against one crop-filter spec."""
+    if ensure_dir:
+        _ensure_output_dir(output_path)
+    pipeline = _build_pipeline(
+        source_paths,
+        crop,
+        output_path,
+        forward_vlrs,
+        output_srs=output_srs,
+    )
+    _run_pipeline(pipeline)
+    return output_path
+
+
+def clip_single_wkt(
+    polygon_wkt: str,
+    source_paths: List[Path],
+    output_path: Path,
+    forward_vlrs: bool = True,
+    output_srs: Optional[str] = None,
+    ensure_dir: bool = True,
+) -> Path:
+    """Clip the given LAS/LAZ sources against an already-serialized polygon."""
+    return clip_single_crop(
+        crop_from_wkt(polygon_wkt),
+        source_paths,
+        output_path,
+        forward_vlrs,
+        output_srs=output_srs,
+        ensure_dir=ensure_dir,
+    )
+
+
+def clip_group_crop(
+    clips: Sequence[Tuple[dict, Path]],
+    source_paths: List[Path],
+    forward_vlrs: bool = True,
+    output_srs: Optional[str] = None,
+    ensure_dirs: bool = True,
+) -> List[Path]:
+    """Clip many polygons sharing the same sources in a single PDAL run."""
+    output_paths = [output_path for _, output_path in clips]
+    if ensure_dirs:
+        _ensure_output_dirs(output_paths)
+    pipeline = _build_group_pipeline(
+        source_paths, clips, forward_vlrs, output_srs=output_srs
+    )
+    _run_pipeline(pipeline)
+    return output_paths
+
+
+def clip_group_wkt(
+    clips: Sequence[Tuple[str, Path]],
+    source_paths: List[Path],
+    forward_vlrs: bool = True,
+    output_srs: Optional[str] = None,
+) -> List[Path]:
+    """clip_group_crop over inline-WKT polygons."""
+    return clip_group_crop(
+        [
+            (crop_from_wkt(polygon_wkt), output_path)
+            for polygon_wkt, output_path in clips
+        ],
+        source_paths,
+        forward_vlrs,
+        output_srs=output_srs,
+    )
+
+
+def clip_single(
+    geometry,
+    source_paths: List[Path],
+    output_path: Path,
+    forward_vlrs: bool = True,
+    output_srs: Optional[str] = None,
+) -> Path:
+    """Clip the given LAS/LAZ sources against one polygon geometry."""
+    return clip_single_wkt(
+        geometry_to_wkt(geometry),
+        source_paths,
+        output_path,
+        forward_vlrs,
+        output_srs=output_srs,
+    )
+
+
 def clip_polygons(
     polygons: GeoSeries,
     polygon_records: Iterable[PolygonSources],
@@ -85,21 +290,21 @@ def clip_polygons(
 ) -> List[Path]:
     """Clip LAS/LAZ files per polygon, returning produced output paths."""
     output_paths: List[Path] = []
+    wkts = geometries_to_wkt(polygons.values)
+    # All outputs land directly in output_dir; one mkdir covers the lot.
+    output_dir.mkdir(parents=True, exist_ok=True)
     for record in polygon_records:
         if not record.source_paths:
             continue
-        geometry = polygons.iloc[record.polygon_id]
-        polygon_wkt = _geometry_to_wkt(geometry)
         output_path = output_dir / name_builder(record.polygon_id)
-        _ensure_output_dir(output_path)
-        pipeline = _build_pipeline(
+        clip_single_wkt(
+            wkts[record.polygon_id],
             record.source_paths,
-            polygon_wkt,
             output_path,
             forward_vlrs,
             output_srs=output_srs,
+            ensure_dir=False,
         )
-        _run_pipeline(pipeline)
         output_paths.append(output_path)
     return output_paths
 
@@ -2,26 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
 
-import geopandas as gpd
-from pyproj import CRS
+from pyproj import CRS, Transformer
+
+if TYPE_CHECKING:
+    import geopandas as gpd
 
 
 class CRSValidationError(ValueError):
     """Raised when CRS requirements are not satisfied."""
 
 
+@lru_cache(maxsize=64)
+def _crs_from_string(value: str) -> CRS:
+    return CRS.from_user_input(value)
+
+
+@lru_cache(maxsize=32)
+def cached_transformer(crs_from: str, crs_to: str) -> Transformer:
+    """Return a reusable Transformer; constructing one is far costlier than a lookup."""
+    return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
 def _to_crs(crs_input: object) -> CRS:
     if crs_input is None:
         raise CRSValidationError("CRS is undefined")
     try:
-        return CRS.from_user_input(crs_input)
+        if isinstance(crs_input, CRS):
+            return crs_input
+        return _crs_from_string(str(crs_input))
     except Exception as exc:  # pragma: no cover - pyproj error details vary
         raise CRSValidationError(f"Invalid CRS: {crs_input}") from exc
 
 
-def validate_polygon_crs(polygons: gpd.GeoDataFrame, source_hint: str | None = None) -> CRS:
+def crs_equal(left: object, right: object) -> bool:
+    """True when both inputs resolve to the same CRS; False if either is unset."""
+    if left is None or right is None:
+        return False
+    try:
+        return _to_crs(left).equals(_to_crs(right))
+    except CRSValidationError:
+        return False
+
+
+def validate_polygon_crs(
+    polygons: "gpd.GeoDataFrame", source_hint: str | None = None
+) -> CRS:
     """Ensure polygon data has a defined CRS and return it as a pyproj CRS."""
     hint = f" ({source_hint})" if source_hint else ""
     if polygons.crs is None:
@@ -31,19 +59,23 @@ def validate_polygon_crs(polygons: gpd.GeoDataFrame, source_hint: str | None = N
 
 def ensure_consistent_las_crs(crs_candidates: Iterable[object]) -> CRS:
     """Verify all LAS sources share a single CRS and return it."""
-    resolved = []
+    # Sources overwhelmingly repeat one CRS, so dedupe the raw inputs first
+    # and resolve each distinct value through pyproj only once.
+    resolved: dict[str, CRS] = {}
     for value in crs_candidates:
         if value is None:
             raise CRSValidationError("Encountered LAS source without CRS")
-        resolved.append(_to_crs(value))
-    unique: set[str] = {crs.to_string() for crs in resolved}
-    if not unique:
+        key = value if isinstance(value, str) else str(value)
+        if key not in resolved:
+            resolved[key] = _to_crs(value)
+    if not resolved:
         raise CRSValidationError("No LAS CRS information was provided")
+    unique: set[str] = {crs.to_string() for crs in resolved.values()}
     if len(unique) > 1:
         raise CRSValidationError(
             "Mixed CRS detected across LAS sources; align inputs before clipping"
         )
-    return resolved[0]
+    return next(iter(resolved.values()))
 
 
 def select_output_crs(las_crs: Optional[CRS]) -> CRS:
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import List, Sequence
 
 import geopandas as gpd
+import numpy as np
+from shapely import STRtree
+from shapely import transform as shapely_transform
 
-from .crs import CRSValidationError
+from .crs import CRSValidationError, cached_transformer
 from .tindex import PATH_FIELD
 
 
@@ -31,29 +33,88 @@ def _align_tindex_crs(polygons: gpd.GeoDataFrame, tindex: gpd.GeoDataFrame) -> g
     poly_crs = polygons.crs
     try:
         if poly_crs.to_string() != tindex.crs.to_string():
-            return tindex.to_crs(poly_crs)
+            transformer = cached_transformer(
+                tindex.crs.to_string(), poly_crs.to_string()
+            )
+
+            def _apply(coords: np.ndarray) -> np.ndarray:
+                xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+                return np.column_stack([xs, ys])
+
+            reprojected = tindex.copy()
+            reprojected.geometry = shapely_transform(tindex.geometry.values, _apply)
+            return reprojected.set_crs(poly_crs, allow_override=True)
     except Exception as exc:
         raise SourceSelectionError(
             "Failed to reproject tile index to polygon CRS"
         ) from exc
     return tindex
 
+def _minimal_tindex(tindex: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Project the tindex down to geometry + path before any copy happens.
+
+    The underlying arrays are shared with the original frame; only the
+    two columns the matcher touches get carried into reprojection copies,
+    regardless of how much metadata the tindex file holds.
+    """
+    if len(tindex.columns) <= 2:
+        return tindex
+    return gpd.GeoDataFrame(
+        {PATH_FIELD: tindex[PATH_FIELD].to_numpy()},
+        geometry=tindex.geometry.values,
+        crs=tindex.crs,
+    )
+
+
 def match_polygons_to_sources(
     polygons: gpd.GeoDataFrame,
     tindex: gpd.GeoDataFrame,
 ) -> Sequence[PolygonSources]:
-    """Return a mapping of polygon index to intersecting LAS file paths."""
+    """Return a mapping of polygon index to intersecting LAS file paths.
+
+    Matching is a pure intersects-predicate join over an STRtree — no
+    intersection geometry is ever computed, since only the pairing is used.
+    """
     if PATH_FIELD not in tindex.columns:
         raise SourceSelectionError(f"Tile index missing required column '{PATH_FIELD}'")
-    tindex = _align_tindex_crs(polygons, tindex)
-    intersections = gpd.overlay(polygons.reset_index(), tindex[["geometry", PATH_FIELD]], how="intersection")
-    mapping: Dict[int, List[Path]] = defaultdict(list)
-    for _, row in intersections.iterrows():
-        polygon_idx = row["index"]
-        mapping[polygon_idx].append(Path(row[PATH_FIELD]))
+    tindex = _align_tindex_crs(polygons, _minimal_tindex(tindex))
+
+    # Polygons whose bbox misses the tindex coverage bbox can never match;
+    # cull them before the geometric join.
+    minx, miny, maxx, maxy = tindex.total_bounds
+    bounds = polygons.geometry.bounds
+    inside = ~(
+        (bounds["maxx"].to_numpy() < minx)
+        | (bounds["minx"].to_numpy() > maxx)
+        | (bounds["maxy"].to_numpy() < miny)
+        | (bounds["miny"].to_numpy() > maxy)
+    )
+    inside_indices = np.flatnonzero(inside)
+    if inside_indices.size == 0:
+        return []
+
+    tree = STRtree(tindex.geometry.values)
+    relative_indices, tile_indices = tree.query(
+        polygons.geometry.values[inside_indices], predicate="intersects"
+    )
+    poly_indices = inside_indices[relative_indices]
+    # One Path per tile row, built once; polygons sharing a tile reuse the
+    # same object instead of re-parsing the string per hit.
+    tile_paths = [Path(value) for value in tindex[PATH_FIELD].tolist()]
+
+    # Group tile hits per polygon with numpy instead of a Python accumulation
+    # loop: one stable sort plus one split over the whole hit table.
+    order = np.argsort(poly_indices, kind="stable")
+    poly_sorted = poly_indices[order]
+    tile_sorted = tile_indices[order]
+    unique_ids, starts = np.unique(poly_sorted, return_index=True)
+    grouped = np.split(tile_sorted, starts[1:])
     results = [
-        PolygonSources(polygon_id=index, source_paths=paths)
-        for index, paths in mapping.items()
+        PolygonSources(
+            polygon_id=int(polygon_id),
+            source_paths=[tile_paths[tile] for tile in group.tolist()],
+        )
+        for polygon_id, group in zip(unique_ids.tolist(), grouped)
     ]
     return results
 
@@ -64,12 +125,11 @@ def match_polygons_with_empty_reports(
 ) -> Sequence[PolygonSources]:
     """Like match_polygons_to_sources, but include polygons without hits."""
     matches = match_polygons_to_sources(polygons, tindex)
-    matched_ids = {entry.polygon_id for entry in matches}
-    all_results = list(matches)
-    for idx in polygons.reset_index()["index"]:
-        if idx not in matched_ids:
-            all_results.append(PolygonSources(polygon_id=idx, source_paths=[]))
-    return sorted(all_results, key=lambda entry: entry.polygon_id)
+    by_id = {entry.polygon_id: entry for entry in matches}
+    return [
+        by_id.get(polygon_id, PolygonSources(polygon_id=polygon_id, source_paths=[]))
+        for polygon_id in range(len(polygons))
+    ]
 
 
 
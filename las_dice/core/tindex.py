@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import sqlite3
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple
 
-import geopandas as gpd
+if TYPE_CHECKING:
+    import geopandas as gpd
+    import pandas as pd
 
 
 TINDEX_DRIVER = "GPKG"
@@ -20,31 +29,109 @@ class TindexError(RuntimeError):
     """Raised when tindex operations fail."""
 
 
-def _pdal_command(args: List[str], stdin: bytes | None = None) -> None:
-    try:
-        subprocess.run(
-            args,
-            check=True,
-            capture_output=True,
-            input=stdin,
-        )
-    except subprocess.CalledProcessError as exc:  # pragma: no cover
-        stderr = exc.stderr.decode("utf-8", errors="ignore") if exc.stderr else ""
-        raise TindexError(f"PDAL command failed: {' '.join(args)}\n{stderr}") from exc
-
-
-def _gather_files(roots: Iterable[Path | str]) -> List[Path]:
-    files: List[Path] = []
-    for root in roots:
-        root_path = Path(root).resolve()
-        if not root_path.exists():
-            raise FileNotFoundError(f"Root directory does not exist: {root_path}")
-        for suffix in _SUPPORTED_SUFFIXES:
-            files.extend(root_path.rglob(f"*{suffix}"))
-    unique_files = sorted({path.resolve() for path in files})
-    if not unique_files:
+def _pdal_command(args: List[str], stdin_lines: Iterable[str] | None = None) -> None:
+    """Run a PDAL command, streaming stdin_lines into the child one at a time.
+
+    Streaming keeps only the pipe buffer in flight instead of one joined
+    bytes blob for the whole file list, and the child starts consuming while
+    we are still writing. stderr is drained on a background thread so a
+    chatty child cannot deadlock against a full pipe.
+    """
+    process = subprocess.Popen(
+        args,
+        stdin=subprocess.PIPE if stdin_lines is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=1 << 20,
+    )
+    stderr_chunks: List[bytes] = []
+
+    def _drain_stderr() -> None:
+        stderr_chunks.append(process.stderr.read())
+
+    drainer = threading.Thread(target=_drain_stderr, daemon=True)
+    drainer.start()
+    if stdin_lines is not None:
+        try:
+            try:
+                for line in stdin_lines:
+                    process.stdin.write(line.encode("utf-8"))
+                    process.stdin.write(b"\n")
+            finally:
+                process.stdin.close()
+        except BrokenPipeError:  # pragma: no cover - child died mid-write
+            pass
+    drainer.join()
+    if process.wait() != 0:
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="ignore")
+        raise TindexError(f"PDAL command failed: {' '.join(args)}\n{stderr}")
+
+
+def _scandir_recursive(root: str) -> Iterable[str]:
+    """Yield LAS/LAZ file paths under root via an iterative os.scandir walk.
+
+    DirEntry carries the file type from the directory read itself, so this
+    does one getdents per directory and no stat per file — unlike
+    Path.rglob, which stats every entry it matches.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                name = entry.name
+                if name[name.rfind(".") :].lower() not in _SUPPORTED_SUFFIXES:
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    # Already canonical: the root was realpath'd once and
+                    # entry.path just extends it.
+                    yield entry.path
+                elif entry.is_file():
+                    # Symlinked file: the one case that still needs realpath,
+                    # so duplicates collapse onto their target.
+                    yield os.path.realpath(entry.path)
+
+
+@lru_cache(maxsize=128)
+def _resolved_root(root: str) -> str:
+    """Canonical root directory, memoized for the life of the process.
+
+    Roots recur across build_tindex and ensure_lax_sidecars in one run, and
+    each realpath walks every path component; validate once and reuse.
+    """
+    resolved = os.path.realpath(root)
+    if not os.path.isdir(resolved):
+        raise FileNotFoundError(f"Root directory does not exist: {resolved}")
+    return resolved
+
+
+def _gather_files(
+    roots: Iterable[Path | str], *, max_workers: Optional[int] = None
+) -> List[Path]:
+    # Resolve each root once; entry.path then concatenates already-resolved
+    # prefixes, so no per-file resolve() is needed.
+    root_paths = [_resolved_root(os.fspath(root)) for root in roots]
+
+    unique: set = set()
+    if len(root_paths) > 1:
+        # Walks are getdents-latency-bound (the GIL is released in the
+        # syscall), so overlapping the roots in threads stacks up nicely on
+        # network filesystems where roots sit on separate mounts.
+        def _walk(root: str) -> List[str]:
+            return list(_scandir_recursive(root))
+
+        workers = min(len(root_paths), max_workers or (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for found in pool.map(_walk, root_paths):
+                unique.update(found)
+    else:
+        for root_path in root_paths:
+            unique.update(_scandir_recursive(root_path))
+    if not unique:
         raise TindexError("No LAS/LAZ files found under provided roots")
-    return unique_files
+    return [Path(value) for value in sorted(unique)]
 
 
 def build_tindex(
@@ -56,9 +143,25 @@ def build_tindex(
     overwrite: bool = False,
     fast_boundary: bool = False,
     target_srs: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    tindex_format: str = "gpkg",
+    spatial_index: bool = True,
 ) -> Path:
-    file_paths = _gather_files(roots)
+    if tindex_format not in ("gpkg", "parquet"):
+        raise TindexError(f"Unsupported tindex format '{tindex_format}'")
     output_path = Path(output).resolve()
+    # read_tindex dispatches on the suffix, so a format/suffix mismatch
+    # would produce an index nothing can read back; fail before the walk.
+    suffix = output_path.suffix.lower()
+    if tindex_format == "parquet" and suffix != ".parquet":
+        raise TindexError(
+            f"tindex_format 'parquet' requires a .parquet output, got '{output_path.name}'"
+        )
+    if tindex_format != "parquet" and suffix == ".parquet":
+        raise TindexError(
+            f"Output '{output_path.name}' has a .parquet suffix; use tindex_format='parquet'"
+        )
+    file_paths = _gather_files(roots, max_workers=max_workers)
     if output_path.exists() and not overwrite:
         raise TindexError(
             f"Tindex destination '{output_path}' already exists. "
@@ -67,7 +170,31 @@ def build_tindex(
     if output_path.exists() and overwrite:
         output_path.unlink()
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    stdin_bytes = "\n".join(str(path) for path in file_paths).encode("utf-8")
+    if tindex_format == "parquet":
+        # PDAL writes through OGR, so stage a GPKG and convert: the tindex
+        # is written once but read many times, and GeoParquet reloads are
+        # several times faster than decoding SQLite pages through OGR.
+        with tempfile.TemporaryDirectory(prefix="las_dice_tindex_") as staging:
+            staging_gpkg = Path(staging) / "tindex.gpkg"
+            _run_pdal_tindex(
+                staging_gpkg, layer, TINDEX_DRIVER, fast_boundary, target_srs, file_paths
+            )
+            _load_tindex(staging_gpkg, layer, None).to_parquet(output_path)
+        return output_path
+    _run_pdal_tindex(output_path, layer, driver, fast_boundary, target_srs, file_paths)
+    if not spatial_index and output_path.suffix.lower() == ".gpkg":
+        _drop_gpkg_spatial_index(output_path, layer)
+    return output_path
+
+
+def _run_pdal_tindex(
+    output_path: Path,
+    layer: str,
+    driver: str,
+    fast_boundary: bool,
+    target_srs: Optional[str],
+    file_paths: List[Path],
+) -> None:
     args = [
         "pdal",
         "tindex",
@@ -87,27 +214,129 @@ def build_tindex(
         args.append("--fast_boundary")
     if target_srs:
         args.extend(["--t_srs", target_srs])
-    _pdal_command(args, stdin=stdin_bytes)
-    return output_path
+    _pdal_command(args, stdin_lines=(str(path) for path in file_paths))
+
+
+def _drop_gpkg_spatial_index(path: Path, layer: str) -> None:
+    """Drop the GPKG R-tree for layer, including its maintenance triggers.
+
+    pdal tindex exposes no layer-creation options, so the index cannot be
+    suppressed at insert time; stripping it afterwards still shrinks the
+    file and removes trigger overhead for bulk-read-only tindexes.
+    """
+    connection = sqlite3.connect(str(path))
+    try:
+        row = connection.execute(
+            "SELECT column_name FROM gpkg_geometry_columns WHERE table_name = ?",
+            (layer,),
+        ).fetchone()
+        if row is None:
+            return
+        prefix = f"rtree_{layer}_{row[0]}"
+        trigger_names = [
+            name
+            for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE ?",
+                (f"{prefix}%",),
+            )
+        ]
+        for name in trigger_names:
+            connection.execute(f'DROP TRIGGER IF EXISTS "{name}"')
+        connection.execute(f'DROP TABLE IF EXISTS "{prefix}"')
+        connection.execute(
+            "DELETE FROM gpkg_extensions WHERE table_name = ? "
+            "AND extension_name = 'gpkg_rtree_index'",
+            (layer,),
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
 
+def vacuum_gpkg(path: Path | str) -> Tuple[int, int]:
+    """Run VACUUM/ANALYZE on a GeoPackage; returns (size_before, size_after)."""
+    resolved = Path(path).resolve()
+    if resolved.suffix.lower() != ".gpkg":
+        raise TindexError(f"Not a GeoPackage: {resolved}")
+    size_before = resolved.stat().st_size
+    connection = sqlite3.connect(str(resolved))
+    try:
+        connection.execute("VACUUM")
+        connection.execute("ANALYZE")
+    finally:
+        connection.close()
+    return size_before, resolved.stat().st_size
+
+
+def ensure_lax_sidecars(
+    roots: Iterable[Path | str], *, max_workers: Optional[int] = None
+) -> List[Path]:
+    """Write missing .lax spatial-index sidecars so crops can skip chunks.
+
+    Requires the LAStools ``lasindex`` executable; raises TindexError when it
+    is not on PATH so callers can degrade gracefully.
+    """
+    executable = shutil.which("lasindex")
+    if executable is None:
+        raise TindexError(
+            "lasindex executable not found on PATH; skipping .lax sidecars"
+        )
+    targets = [
+        path for path in _gather_files(roots) if not path.with_suffix(".lax").exists()
+    ]
+    if not targets:
+        return []
+
+    def _index(path: Path) -> None:
+        result = subprocess.run(
+            [executable, "-i", str(path)], check=False, capture_output=True
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="ignore")
+            raise TindexError(f"lasindex failed for {path}\n{stderr}")
 
-def _normalize_path_column(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(_index, targets))
+    return targets
+
+
+def _normalize_path_column(gdf: "gpd.GeoDataFrame") -> "gpd.GeoDataFrame":
+    # Hash the columns once; membership tests against a pandas Index walk it
+    # linearly. The already-normalized case returns without any rename copy.
+    columns = set(gdf.columns)
+    if PATH_FIELD in columns:
+        return gdf
     for column in _CANDIDATE_COLUMNS:
-        if column in gdf.columns:
-            if column != PATH_FIELD:
-                gdf = gdf.rename(columns={column: PATH_FIELD})
-            return gdf
+        if column in columns:
+            return gdf.rename(columns={column: PATH_FIELD})
     raise TindexError(
         f"Tile index missing a recognizable path column (expected one of: {', '.join(_CANDIDATE_COLUMNS)})"
     )
 
 
-def read_tindex(path: Path | str, layer: str = TINDEX_LAYER) -> gpd.GeoDataFrame:
-    resolved = Path(path).expanduser().resolve()
-    if not resolved.exists():
-        raise FileNotFoundError(f"Tindex file not found: {resolved}")
-    gdf = gpd.read_file(resolved, layer=layer)
-    if gdf.empty:
+def _load_tindex(
+    resolved: Path,
+    layer: str,
+    bbox: Optional[Tuple[float, float, float, float]],
+) -> "gpd.GeoDataFrame":
+    import geopandas as gpd
+
+    from .utils import vector_read_kwargs
+
+    if resolved.suffix.lower() == ".parquet":
+        gdf = gpd.read_parquet(resolved)
+        if bbox is not None:
+            minx, miny, maxx, maxy = bbox
+            gdf = gdf.cx[minx:maxx, miny:maxy]
+    else:
+        kwargs = dict(vector_read_kwargs())
+        if bbox is not None:
+            # GDAL filters against the GPKG R-tree, so tiles outside the
+            # area of interest are never decoded. An empty result is then a
+            # valid answer.
+            kwargs["bbox"] = bbox
+        gdf = gpd.read_file(resolved, layer=layer, **kwargs)
+    if gdf.empty and bbox is None:
         raise TindexError(f"Tile index '{resolved}' contains no records")
     gdf = _normalize_path_column(gdf)
     if gdf.crs is None:
@@ -115,13 +344,142 @@ def read_tindex(path: Path | str, layer: str = TINDEX_LAYER) -> gpd.GeoDataFrame
     return gdf
 
 
-def describe_tindex(path: Path | str, layer: str = TINDEX_LAYER) -> Iterable[str]:
+def _load_tindex_attributes(
+    resolved: Path, layer: str, columns: Optional[Tuple[str, ...]]
+) -> "pd.DataFrame":
+    """Attribute-only tindex read: WKB geometry is never decoded.
+
+    Decoding geometry is the dominant cost of a full read, so path-lookup
+    callers that only need attribute columns should come through here.
+    """
+    if resolved.suffix.lower() == ".parquet":
+        import pandas as pd
+
+        frame = pd.read_parquet(resolved, columns=list(columns) if columns else None)
+        if columns is None and "geometry" in frame.columns:
+            frame = frame.drop(columns=["geometry"])
+        return frame
+    try:
+        import pyogrio
+    except ImportError:
+        gdf = _load_tindex(resolved, layer, None)
+        frame = gdf.drop(columns=gdf.geometry.name)
+        return frame[list(columns)] if columns else frame
+    return pyogrio.read_dataframe(
+        str(resolved),
+        layer=layer,
+        read_geometry=False,
+        columns=list(columns) if columns else None,
+    )
+
+
+@lru_cache(maxsize=8)
+def _read_tindex_cached(resolved: str, layer: str, mtime_ns: int) -> "gpd.GeoDataFrame":
+    return _load_tindex(Path(resolved), layer, None)
+
+
+def read_tindex(
+    path: Path | str,
+    layer: str = TINDEX_LAYER,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    columns: Optional[Sequence[str]] = None,
+    with_geometry: bool = True,
+) -> "gpd.GeoDataFrame":
+    """Load a tile index, reusing a cached frame for repeated full reads.
+
+    The cache key includes the file's mtime so a rebuilt tindex invalidates
+    naturally; callers share the cached frame and must not mutate it.
+    bbox-filtered reads bypass the cache since each AOI differs.
+
+    with_geometry=False returns a plain DataFrame with no geometry decoded
+    at all — the cheap option when the tindex is only a path lookup table.
+    With columns=None the path column is normalized as usual; an explicit
+    columns selection is forwarded verbatim.
+    """
+    resolved = Path(path).expanduser().resolve()
+    if not resolved.exists():
+        raise FileNotFoundError(f"Tindex file not found: {resolved}")
+    if not with_geometry:
+        frame = _load_tindex_attributes(
+            resolved, layer, tuple(columns) if columns else None
+        )
+        if frame.empty:
+            raise TindexError(f"Tile index '{resolved}' contains no records")
+        return frame if columns else _normalize_path_column(frame)
+    if bbox is not None:
+        return _load_tindex(resolved, layer, bbox)
+    return _read_tindex_cached(str(resolved), layer, resolved.stat().st_mtime_ns)
+
+
+def read_tindex_with_index(
+    path: Path | str, layer: str = TINDEX_LAYER
+) -> "gpd.GeoDataFrame":
+    """read_tindex plus an eagerly-built spatial index on the cached frame.
+
+    sindex is cached on the GeoDataFrame itself, so repeated spatial queries
+    against the same tindex reuse one R-tree build.
+    """
     gdf = read_tindex(path, layer)
-    yield f"Tindex path: {Path(path).resolve()}"
+    gdf.sindex  # noqa: B018 - building the tree is the point
+    return gdf
+
+
+def _tindex_summary(resolved: Path, layer: str) -> Tuple[int, str, List[str]]:
+    """(feature count, CRS text, sample paths) without loading the full layer.
+
+    GeoPackage metadata already holds the count, CRS and path column, so the
+    summary comes straight out of sqlite3 without decoding a single feature;
+    other formats degrade to a full read.
+    """
+    if resolved.suffix.lower() != ".gpkg":
+        gdf = read_tindex(resolved, layer)
+        return len(gdf), gdf.crs.to_string(), gdf[PATH_FIELD].head(5).tolist()
+    connection = sqlite3.connect(str(resolved))
+    try:
+        srs_row = connection.execute(
+            "SELECT srs.srs_id, srs.organization, srs.organization_coordsys_id "
+            "FROM gpkg_contents AS contents "
+            "JOIN gpkg_spatial_ref_sys AS srs ON contents.srs_id = srs.srs_id "
+            "WHERE contents.table_name = ?",
+            (layer,),
+        ).fetchone()
+        if srs_row is None:
+            raise TindexError(f"Layer '{layer}' not found in tile index '{resolved}'")
+        srs_id, organization, coordsys_id = srs_row
+        # 0 and -1 are the GPKG sentinels for an undefined SRS.
+        if srs_id in (0, -1):
+            raise TindexError(
+                "Tile index CRS is undefined; rebuild with CRS information"
+            )
+        crs_text = f"{organization}:{coordsys_id}"
+        count = connection.execute(f'SELECT COUNT(*) FROM "{layer}"').fetchone()[0]
+        if count == 0:
+            raise TindexError(f"Tile index '{resolved}' contains no records")
+        columns = {
+            row[1] for row in connection.execute(f'PRAGMA table_info("{layer}")')
+        }
+        column = next((name for name in _CANDIDATE_COLUMNS if name in columns), None)
+        if column is None:
+            raise TindexError(
+                f"Tile index missing a recognizable path column (expected one of: {', '.join(_CANDIDATE_COLUMNS)})"
+            )
+        sample_rows = connection.execute(
+            f'SELECT "{column}" FROM "{layer}" LIMIT 5'
+        )
+        return int(count), crs_text, [row[0] for row in sample_rows]
+    finally:
+        connection.close()
+
+
+def describe_tindex(path: Path | str, layer: str = TINDEX_LAYER) -> Iterable[str]:
+    resolved = Path(path).expanduser().resolve()
+    if not resolved.exists():
+        raise FileNotFoundError(f"Tindex file not found: {resolved}")
+    count, crs_text, sample = _tindex_summary(resolved, layer)
+    yield f"Tindex path: {resolved}"
     yield f"Layer: {layer}"
-    yield f"Features: {len(gdf)}"
-    yield f"CRS: {gdf.crs.to_string()}"
-    sample = gdf[PATH_FIELD].head(5).tolist()
+    yield f"Features: {count}"
+    yield f"CRS: {crs_text}"
     yield "Sample paths:" if sample else "No sample paths available"
     for item in sample:
         yield f"  - {item}"
@@ -4,14 +4,25 @@ from __future__ import annotations
 
 import csv
 import json
+import queue
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Sequence
 
 from rich.console import Console
+
+if TYPE_CHECKING:
+    import pandas as pd
 from rich.progress import Progress
 
+try:  # orjson keeps the per-row serialization loop in C
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 console = Console()
 
@@ -22,24 +33,104 @@ class NamingOptions:
     suffix: str | None
 
 
+# Maps every ASCII char that is not alphanumeric, '-', or '_' to '_'.
+_ASCII_SANITIZE_TABLE = str.maketrans(
+    {chr(code): "_" for code in range(128) if not (chr(code).isalnum() or chr(code) in "-_")}
+)
+
+
 def sanitize(value: str, default: str = "unnamed") -> str:
-    cleaned = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in value).strip("_")
+    if value.isascii():
+        cleaned = value.translate(_ASCII_SANITIZE_TABLE).strip("_")
+    else:
+        cleaned = "".join(
+            ch if ch.isalnum() or ch in "-_" else "_" for ch in value
+        ).strip("_")
     return cleaned or default
 
 
+def sanitize_series(values: "pd.Series", default: str = "unnamed") -> "pd.Series":
+    """Vectorized sanitize for a pandas Series of candidate names.
+
+    The replace runs on object dtype on purpose: Arrow-backed str columns
+    route regex through RE2, where \\w is ASCII-only and non-ASCII
+    alphanumerics would be squashed to '_', diverging from sanitize.
+    Missing values become the default name; astype(str) would keep them as
+    NaN and leak a float out of the name builder.
+    """
+    cleaned = (
+        values.where(values.notna(), default)
+        .astype(str)
+        .astype(object)
+        .str.replace(r"[^\w-]", "_", regex=True)
+        .str.strip("_")
+    )
+    return cleaned.where(cleaned != "", default)
+
+
 def build_name_getter(options: NamingOptions) -> Callable[[dict], str]:
-    def _getter(attributes: dict) -> str:
-        base = attributes.get(options.field, "") if options.field else "polygon"
-        stem = sanitize(str(base))
-        if options.suffix:
-            return f"{stem}_{sanitize(options.suffix)}"
-        return stem
+    """Return a name getter specialized for the given options.
+
+    The field/suffix branching happens once here rather than per polygon,
+    and the suffix is sanitized a single time up front, so the returned
+    callable does the minimum work on the hot path.
+    """
+    field = options.field
+    if options.suffix:
+        suffix = f"_{sanitize(options.suffix)}"
+        if field:
+
+            def _getter(attributes: dict) -> str:
+                return sanitize(str(attributes.get(field, ""))) + suffix
+
+        else:
+
+            def _getter(attributes: dict) -> str:
+                return f"polygon{suffix}"
+
+    elif field:
+
+        def _getter(attributes: dict) -> str:
+            return sanitize(str(attributes.get(field, "")))
+
+    else:
+
+        def _getter(attributes: dict) -> str:
+            return "polygon"
 
     return _getter
 
 
-def build_output_path(name: str, outdir: Path, extension: str = ".las") -> Path:
-    return outdir / f"{name}{extension}"
+@lru_cache(maxsize=1)
+def vector_read_kwargs() -> dict:
+    """Keyword arguments selecting the fastest available geopandas read engine.
+
+    pyogrio reads whole layers through vectorized OGR batch APIs instead of
+    Fiona's per-feature loop, and Arrow transfer (when pyarrow is present)
+    skips per-column Python conversion on top. Falls back to geopandas
+    defaults when neither is installed. Probed lazily so importing this
+    module stays cheap.
+    """
+    try:
+        import pyogrio  # noqa: F401
+    except ImportError:
+        return {}
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return {"engine": "pyogrio"}
+    return {"engine": "pyogrio", "use_arrow": True}
+
+
+OUTPUT_EXTENSION = ".laz"
+
+
+def build_output_name(name: str, extension: str = OUTPUT_EXTENSION) -> str:
+    return f"{name}{extension}"
+
+
+def build_output_path(name: str, outdir: Path, extension: str = OUTPUT_EXTENSION) -> Path:
+    return outdir / build_output_name(name, extension)
 
 
 def log_info(message: str) -> None:
@@ -53,27 +144,100 @@ def status(message: str):
 
 
 @contextmanager
-def progress_tracker(task_description: str, total: int) -> Callable[[int], None]:
-    with Progress(console=console) as progress:
-        task_id = progress.add_task(task_description, total=total)
-
-        def advance(step: int = 1) -> None:
+def progress_tracker(
+    task_description: str, total: int, progress: Optional[Progress] = None
+) -> Callable[[int], None]:
+    """Yield an advance() callable whose updates render on a background thread.
+
+    The caller's hot loop only enqueues a step count; terminal redraws happen
+    off the critical path in a drain thread, which also coalesces bursts of
+    queued ticks into one advance per wakeup. Pass an existing Progress to
+    share a single live display across workflow steps.
+    """
+    owns_progress = progress is None
+    if owns_progress:
+        progress = Progress(console=console, refresh_per_second=10)
+        progress.start()
+    task_id = progress.add_task(task_description, total=total)
+    updates: queue.Queue[int] = queue.Queue()
+    finished = threading.Event()
+
+    def _drain() -> None:
+        while not (finished.is_set() and updates.empty()):
+            try:
+                step = updates.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            while True:
+                try:
+                    step += updates.get_nowait()
+                except queue.Empty:
+                    break
             progress.advance(task_id, step)
 
+    drainer = threading.Thread(target=_drain, daemon=True)
+    drainer.start()
+
+    def advance(step: int = 1) -> None:
+        updates.put(step)
+
+    try:
         yield advance
+    finally:
+        finished.set()
+        drainer.join()
+        if owns_progress:
+            progress.stop()
 
 
 def write_csv_log(path: Path, rows: Sequence[Mapping[str, object]], fieldnames: Iterable[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    fieldnames = list(fieldnames)
+    try:
+        import pandas as pd
+    except ImportError:
+        with path.open("w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+    # to_csv runs the row loop in C; DictWriter pays Python per row.
+    pd.DataFrame(list(rows), columns=fieldnames).to_csv(
+        path, index=False, lineterminator="\n"
+    )
 
 
 def write_jsonl_log(path: Path, rows: Sequence[Mapping[str, object]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with path.open("wb") as handle:
+            for row in rows:
+                handle.write(orjson.dumps(row))
+                handle.write(b"\n")
+        return
     with path.open("w") as handle:
         for row in rows:
             handle.write(json.dumps(row))
             handle.write("\n")
+
+
+@contextmanager
+def jsonl_log_stream(path: Path):
+    """Open a JSONL log and yield an append(row) callable for incremental writes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with path.open("wb") as binary_handle:
+
+            def append_bytes(row: Mapping[str, object]) -> None:
+                binary_handle.write(orjson.dumps(row))
+                binary_handle.write(b"\n")
+
+            yield append_bytes
+        return
+    with path.open("w") as handle:
+
+        def append(row: Mapping[str, object]) -> None:
+            handle.write(json.dumps(row))
+            handle.write("\n")
+
+        yield append
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:  # orjson parses and serializes config JSON several times faster
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 DEFAULT_CONFIG_NAME = "las_dice_config.json"
 
 
@@ -39,13 +44,21 @@ class RunConfig:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        result["polygons"] = str(self.polygons)
-        result["las_roots"] = [str(item) for item in self.las_roots]
-        result["tindex_path"] = str(self.tindex_path)
-        result["output_dir"] = str(self.output_dir)
-        if self.target_srs is None:
-            result.pop("target_srs", None)
+        # Built explicitly: asdict deep-copies every field before four of
+        # them get replaced with stringified versions anyway.
+        result: Dict[str, Any] = {
+            "polygons": str(self.polygons),
+            "polygons_layer": self.polygons_layer,
+            "las_roots": [str(item) for item in self.las_roots],
+            "tindex_path": str(self.tindex_path),
+            "tindex_layer": self.tindex_layer,
+            "output_dir": str(self.output_dir),
+            "name_field": self.name_field,
+            "suffix": self.suffix,
+            "fast_boundary": self.fast_boundary,
+        }
+        if self.target_srs is not None:
+            result["target_srs"] = self.target_srs
         return result
 
 
@@ -53,14 +66,22 @@ def load_config(path: Path | None = None) -> RunConfig:
     config_path = Path(path or DEFAULT_CONFIG_NAME)
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
-    with config_path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    if orjson is not None:
+        raw = orjson.loads(config_path.read_bytes())
+    else:
+        with config_path.open("r", encoding="utf-8") as handle:
+            raw = json.load(handle)
     return RunConfig.from_dict(raw)
 
 
 def save_config(config: RunConfig, path: Path | None = None) -> Path:
     config_path = Path(path or DEFAULT_CONFIG_NAME)
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with config_path.open("w", encoding="utf-8") as handle:
-        json.dump(config.to_dict(), handle, indent=2)
+    if orjson is not None:
+        config_path.write_bytes(
+            orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2)
+        )
+    else:
+        with config_path.open("w", encoding="utf-8") as handle:
+            json.dump(config.to_dict(), handle, indent=2)
     return config_path
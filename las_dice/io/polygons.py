@@ -6,7 +6,8 @@ from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
 import geopandas as gpd
-from fiona import listlayers
+
+from ..core.utils import vector_read_kwargs
 
 AttributeFields = List[str]
 ReadResult = Tuple[gpd.GeoDataFrame, Optional[str], int, AttributeFields]
@@ -20,7 +21,14 @@ def list_layers(path: Path | str) -> List[str]:
         raise FileNotFoundError(f"Polygon source not found: {candidate}")
     if candidate.suffix.lower() != ".gpkg":
         raise ValueError("Layer listing is only supported for GeoPackage files")
-    return listlayers(candidate)
+    try:
+        import pyogrio
+    except ImportError:
+        from fiona import listlayers
+
+        return listlayers(candidate)
+    # pyogrio returns (name, geometry_type) rows without a Fiona session.
+    return [str(name) for name, _ in pyogrio.list_layers(candidate)]
 
 
 def _normalize_path(path: Path | str) -> Path:
@@ -35,12 +43,24 @@ def _normalize_path(path: Path | str) -> Path:
     return candidate
 
 
-def _read_file(path: Path, layer: Optional[str]) -> gpd.GeoDataFrame:
+def _read_file(
+    path: Path,
+    layer: Optional[str],
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    mask: object = None,
+) -> gpd.GeoDataFrame:
+    kwargs = dict(vector_read_kwargs())
+    # Spatial filters are evaluated inside GDAL against the layer's index,
+    # so non-matching features are never decoded.
+    if bbox is not None:
+        kwargs["bbox"] = bbox
+    if mask is not None:
+        kwargs["mask"] = mask
     if path.suffix.lower() == ".gpkg":
-        return gpd.read_file(path, layer=layer)
+        return gpd.read_file(path, layer=layer, **kwargs)
     if layer is not None:
         raise ValueError("Shapefile sources do not support layer selection")
-    return gpd.read_file(path)
+    return gpd.read_file(path, **kwargs)
 
 
 def list_attribute_fields(gdf: gpd.GeoDataFrame) -> AttributeFields:
@@ -48,18 +68,42 @@ def list_attribute_fields(gdf: gpd.GeoDataFrame) -> AttributeFields:
     return [name for name in gdf.columns if name != geometry_name]
 
 
-def read_polygons(path: Path | str, layer: Optional[str] = None) -> ReadResult:
+def read_polygons(
+    path: Path | str,
+    layer: Optional[str] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    mask: object = None,
+) -> ReadResult:
     normalized = _normalize_path(path)
-    geodata = _read_file(normalized, layer)
-    if geodata.empty:
+    geodata = _read_file(normalized, layer, bbox=bbox, mask=mask)
+    if geodata.empty and bbox is None and mask is None:
         raise ValueError(f"Polygon source '{normalized}' contains no features")
     crs_text = geodata.crs.to_string() if geodata.crs else None
     fields = list_attribute_fields(geodata)
     return geodata, crs_text, len(geodata), fields
 
 
+def _describe_info(
+    normalized: Path, layer: Optional[str]
+) -> Tuple[Optional[str], int, AttributeFields]:
+    """(CRS text, feature count, field names) from layer metadata when possible.
+
+    pyogrio.read_info answers all three through OGR metadata calls without
+    decoding a single feature; without pyogrio this falls back to a full read.
+    """
+    try:
+        import pyogrio
+    except ImportError:
+        _, crs_text, feature_count, fields = read_polygons(normalized, layer)
+        return crs_text, feature_count, fields
+    info = pyogrio.read_info(str(normalized), layer=layer)
+    crs_text = str(info["crs"]) if info.get("crs") else None
+    return crs_text, int(info["features"]), [str(name) for name in info["fields"]]
+
+
 def describe_fields(path: Path | str, layer: Optional[str] = None) -> Iterable[str]:
-    geodata, crs_text, feature_count, fields = read_polygons(path, layer)
+    normalized = _normalize_path(path)
+    crs_text, feature_count, fields = _describe_info(normalized, layer)
     yield f"Path: {Path(path).resolve()}"
     if layer:
         yield f"Layer: {layer}"